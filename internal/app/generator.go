@@ -49,6 +49,8 @@ package app
 import (
 	"bufio"
 	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
 	"fmt"
 	"io"
 	"io/fs"
@@ -491,7 +493,7 @@ func action(c *cli.Context) error {
 	spinner.Start()
 
 	pdfCompiled := false
-	err = compileLaTeXToPDF(cfg)
+	err = compileLaTeXToPDF(cfg, RootFilename(pathConfigs[len(pathConfigs)-1]))
 	spinner.Stop()
 
 	if err != nil {
@@ -504,9 +506,10 @@ func action(c *cli.Context) error {
 		if strings.Contains(err.Error(), "executable file not found") {
 			if !silent {
 				fmt.Println(core.Warning("\n⚠️  PDF generation skipped: 'xelatex' not found"))
-				fmt.Println(core.DimText("   LaTeX files have been generated in: " + filepath.Join(cfg.OutputDir, "latex")))
+				latexDir := outputDirsFor(cfg).latex
+				fmt.Println(core.DimText("   LaTeX files have been generated in: " + latexDir))
 				fmt.Println(core.DimText("   To generate PDF manually, install TeX Live/MacTeX and run:"))
-				fmt.Printf("   %s\n", core.CyanText(fmt.Sprintf("cd %s && xelatex %s", filepath.Join(cfg.OutputDir, "latex"), RootFilename(pathConfigs[len(pathConfigs)-1]))))
+				fmt.Printf("   %s\n", core.CyanText(fmt.Sprintf("cd %s && xelatex %s", latexDir, RootFilename(pathConfigs[len(pathConfigs)-1]))))
 			}
 			logger.Warn("PDF compilation skipped (xelatex missing)")
 		} else {
@@ -552,7 +555,7 @@ func runTestCoverage() error {
 	coverageFile := "coverage.out"
 
 	// Run tests with coverage
-	cmd := exec.Command("go", "test", "-mod=vendor", "-coverprofile="+coverageFile, "-covermode=count", "./...")
+	cmd := exec.Command("go", "test", "-mod=mod", "-coverprofile="+coverageFile, "-covermode=count", "./...")
 	output, err := cmd.CombinedOutput()
 
 	// Print test results
@@ -742,7 +745,9 @@ func loadConfiguration(c *cli.Context) (core.Config, []string, error) {
 func loadConfigurationWithTasks(c *cli.Context, tasks []core.Task) (core.Config, []string, error) {
 	initialPathConfigs := strings.Split(c.Path(fConfig), ",")
 
-	cfg, err := core.NewConfig(initialPathConfigs...)
+	// The tasks are already parsed, so the config loader must not read the
+	// CSV again just to derive the date range
+	cfg, err := core.NewConfigWithTasks(tasks, initialPathConfigs...)
 	if err != nil {
 		return core.Config{}, nil, core.NewConfigError(
 			strings.Join(initialPathConfigs, ","),
@@ -757,18 +762,28 @@ func loadConfigurationWithTasks(c *cli.Context, tasks []core.Task) (core.Config,
 		cfg.OutputDir = od
 	}
 
-	// Inject the pre-loaded tasks into the configuration
-	cfg.Tasks = tasks
-	
-	// Calculate date range and months with tasks from the merged data
-	if len(tasks) > 0 {
-		dateRange := core.CalculateDateRange(tasks)
-		cfg.MonthsWithTasks = core.GetMonthsWithTasks(tasks, dateRange)
-	}
-
 	return cfg, initialPathConfigs, nil
 }
 
+// outputDirs holds the resolved output subdirectory paths for a run
+type outputDirs struct {
+	latex     string
+	pdfs      string
+	auxiliary string
+	binaries  string
+}
+
+// outputDirsFor joins the output subdirectory paths for a config in one place,
+// so the subdirectory names are spelled once instead of at every use site
+func outputDirsFor(cfg core.Config) outputDirs {
+	return outputDirs{
+		latex:     filepath.Join(cfg.OutputDir, "latex"),
+		pdfs:      filepath.Join(cfg.OutputDir, "pdfs"),
+		auxiliary: filepath.Join(cfg.OutputDir, "auxiliary"),
+		binaries:  filepath.Join(cfg.OutputDir, "binaries"),
+	}
+}
+
 // setupOutputDirectory ensures the output directory exists and logs its location
 func setupOutputDirectory(cfg core.Config) error {
 	// Create main output directory
@@ -777,12 +792,8 @@ func setupOutputDirectory(cfg core.Config) error {
 	}
 	
 	// Create organized subdirectories
-	subdirs := []string{
-		filepath.Join(cfg.OutputDir, "pdfs"),
-		filepath.Join(cfg.OutputDir, "latex"),
-		filepath.Join(cfg.OutputDir, "auxiliary"),
-		filepath.Join(cfg.OutputDir, "binaries"),
-	}
+	dirs := outputDirsFor(cfg)
+	subdirs := []string{dirs.pdfs, dirs.latex, dirs.auxiliary, dirs.binaries}
 	
 	for _, subdir := range subdirs {
 		if err := os.MkdirAll(subdir, 0o755); err != nil {
@@ -795,34 +806,32 @@ func setupOutputDirectory(cfg core.Config) error {
 }
 
 // generateRootDocument creates the main LaTeX document file
+// The document is streamed through a buffered writer straight to disk, so
+// peak memory stays bounded by the write buffer rather than the full document
 func generateRootDocument(cfg core.Config, pathConfigs []string) error {
-	// Get reusable buffer from pool
-	wr := GetReusableBuffer()
-	defer ReturnBuffer(wr)
-
 	t := NewTpl()
 
 	LogMemoryStats("Before document generation")
 
+	outputFile := filepath.Join(outputDirsFor(cfg).latex, RootFilename(pathConfigs[len(pathConfigs)-1]))
+	f, err := os.OpenFile(outputFile, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0o600)
+	if err != nil {
+		return core.NewFileError(outputFile, "create", err)
+	}
+	defer f.Close()
+
+	wr := bufio.NewWriterSize(f, initialBufferSize)
 	if err := t.Document(wr, cfg); err != nil {
 		return core.NewTemplateError(documentTpl, 0, "failed to generate LaTeX document", err)
 	}
+	if err := wr.Flush(); err != nil {
+		return core.NewFileError(outputFile, "write", err)
+	}
 
 	LogMemoryStats("After document generation")
 
-	logger.Debug("Root document content:\n%s", wr.String())
-
-	outputFile := filepath.Join(cfg.OutputDir, "latex", RootFilename(pathConfigs[len(pathConfigs)-1]))
-	if err := os.WriteFile(outputFile, wr.Bytes(), 0o600); err != nil {
-		return core.NewFileError(outputFile, "write", err)
-	}
 	logger.Debug("Generated LaTeX file: %s", outputFile)
 
-	// Force GC after large document generation to prevent memory buildup
-	if wr.Len() > 1024*1024 { // > 1MB
-		ForceGC()
-	}
-
 	return nil
 }
 
@@ -832,20 +841,28 @@ func generatePages(cfg core.Config, preview bool) error {
 
 	totalPages := len(cfg.Pages)
 	silent := core.IsSilent()
+	// Carriage-return progress updates only make sense on a terminal; in
+	// redirected output (CI logs) print a single line instead of one
+	// rewritten line per page
+	interactive := core.IsInteractive()
+
+	if !silent && !interactive {
+		fmt.Printf("%s (%d pages)\n", core.Info("📅 Generating calendar pages..."), totalPages)
+	}
 
 	for i, file := range cfg.Pages {
-		if !silent {
+		if !silent && interactive {
 			fmt.Print(core.ClearLine())
 			fmt.Printf("%s [%d/%d] %s", core.Info("📅 Generating calendar pages..."), i+1, totalPages, file.Name)
 		}
 		if err := generateSinglePage(cfg, file, t, preview); err != nil {
-			if !silent {
+			if !silent && interactive {
 				fmt.Println() // New line before error
 			}
 			return err
 		}
 	}
-	if !silent {
+	if !silent && interactive {
 		// Add a space so the checkmark printed by the caller appears next to the progress
 		fmt.Print(" ")
 	}
@@ -855,7 +872,10 @@ func generatePages(cfg core.Config, preview bool) error {
 
 // generateSinglePage generates a single page file
 func generateSinglePage(cfg core.Config, file core.Page, t Tpl, preview bool) error {
-	wr := &bytes.Buffer{}
+	// Reuse a pooled buffer so each page render appends into an already-grown
+	// allocation instead of re-growing a fresh buffer from scratch
+	wr := GetReusableBuffer()
+	defer ReturnBuffer(wr)
 
 	// Compose all modules for this page
 	modules, err := composePageModules(cfg, file, preview)
@@ -923,32 +943,71 @@ func validateModuleAlignment(modules []core.Modules, pageName string) error {
 	return nil
 }
 
-// renderModules renders all modules to the writer using the template
+// renderModules renders all modules to the writer using the template.
+// Modules are independent of each other, so they render concurrently into
+// per-module buffers and are written out in their original order.
 func (t Tpl) renderModules(wr io.Writer, modules []core.Modules, file core.Page) error {
 	if len(modules) == 0 {
 		return nil
 	}
 
 	moduleCount := len(modules[0])
+	type rendered struct {
+		buf *bytes.Buffer
+		err error
+	}
+	results := make([]rendered, moduleCount*len(modules))
+
+	var wg sync.WaitGroup
 	for i := 0; i < moduleCount; i++ {
-		for j, mod := range modules {
-			if err := t.Execute(wr, mod[i].Tpl, mod[i]); err != nil {
-				return core.NewTemplateError(
-					mod[i].Tpl,
-					0,
-					fmt.Sprintf("failed to execute template for function %s", file.RenderBlocks[j].FuncName),
-					err,
-				)
+		for j := range modules {
+			wg.Add(1)
+			go func(slot, blockIdx int, mod core.Module) {
+				defer wg.Done()
+				buf := GetReusableBuffer()
+				if err := t.Execute(buf, mod.Tpl, mod); err != nil {
+					ReturnBuffer(buf)
+					results[slot].err = core.NewTemplateError(
+						mod.Tpl,
+						0,
+						fmt.Sprintf("failed to execute template for function %s", file.RenderBlocks[blockIdx].FuncName),
+						err,
+					)
+					return
+				}
+				results[slot].buf = buf
+			}(i*len(modules)+j, j, modules[j][i])
+		}
+	}
+	wg.Wait()
+
+	var firstErr error
+	for _, res := range results {
+		if res.err != nil && firstErr == nil {
+			firstErr = res.err
+		}
+		if res.buf != nil {
+			if firstErr == nil {
+				if _, err := wr.Write(res.buf.Bytes()); err != nil {
+					firstErr = err
+				}
 			}
+			ReturnBuffer(res.buf)
 		}
 	}
 
-	return nil
+	return firstErr
 }
 
-// writePageFile writes the page content to a file
+// writePageFile writes the page content to a file. If the file already holds
+// identical content (a rerun with unchanged inputs), the write is skipped so
+// the mtime stays put and downstream tooling sees no change.
 func writePageFile(cfg core.Config, pageName string, content []byte) error {
-	pageFile := filepath.Join(cfg.OutputDir, "latex", pageName+texExtension)
+	pageFile := filepath.Join(outputDirsFor(cfg).latex, pageName+texExtension)
+	if existing, err := os.ReadFile(pageFile); err == nil && bytes.Equal(existing, content) {
+		logger.Debug("Page unchanged, skipping write: %s", pageFile)
+		return nil
+	}
 	if err := os.WriteFile(pageFile, content, 0o600); err != nil {
 		return core.NewFileError(pageFile, "write", err)
 	}
@@ -961,28 +1020,22 @@ func RootFilename(pathconfig string) string {
 	return strings.TrimSuffix(filename, filepath.Ext(filename)) + texExtension
 }
 
-// latexReplacer is a reusable replacer for escaping LaTeX special characters.
-// It is initialized once and used by EscapeLatex for better performance.
-var latexReplacer = strings.NewReplacer(
-	"&", "\\&",
-	"%", "\\%",
-	"$", "\\$",
-	"#", "\\#",
-	"_", "\\_",
-	"{", "\\{",
-	"}", "\\}",
-	"\\", "\\textbackslash{}",
-	"^", "\\textasciicircum{}",
-	"~", "\\textasciitilde{}",
-	"[", "{[}",
-	"]", "{]}",
-)
-
+// EscapeLatex escapes LaTeX special characters in a single pass.
+// It delegates to the calendar package's precompiled replacer so there is a
+// single escaping table shared by document and calendar rendering.
 func EscapeLatex(s string) string {
-	return latexReplacer.Replace(s)
+	return cal.EscapeLatexSpecialChars(s)
 }
 
-var tpl = func() *template.Template {
+// Template parsing is deferred until the first NewTpl call so that CLI
+// invocations that never render (e.g. --help, flag errors) skip the cost of
+// parsing every embedded template at process start
+var (
+	tplOnce sync.Once
+	tpl     *template.Template
+)
+
+func loadTemplates() *template.Template {
 	// Create template with custom functions
 	t := template.New("").Funcs(TemplateFuncs())
 
@@ -1023,13 +1076,16 @@ var tpl = func() *template.Template {
 
 	logger.Debug("Successfully loaded templates with pattern: %s", templatePattern)
 	return t
-}()
+}
 
 type Tpl struct {
 	tpl *template.Template
 }
 
 func NewTpl() Tpl {
+	tplOnce.Do(func() {
+		tpl = loadTemplates()
+	})
 	return Tpl{
 		tpl: tpl,
 	}
@@ -1050,11 +1106,13 @@ func (t Tpl) Document(wr io.Writer, cfg core.Config) error {
 }
 
 func (t Tpl) Execute(wr io.Writer, name string, data interface{}) error {
-	// Check if template exists before trying to execute
-	if t.tpl.Lookup(name) == nil {
+	// Resolve the template once and execute the result directly;
+	// ExecuteTemplate would repeat the same lookup internally
+	tmpl := t.tpl.Lookup(name)
+	if tmpl == nil {
 		availableTemplates := make([]string, 0)
-		for _, tmpl := range t.tpl.Templates() {
-			availableTemplates = append(availableTemplates, tmpl.Name())
+		for _, available := range t.tpl.Templates() {
+			availableTemplates = append(availableTemplates, available.Name())
 		}
 		return core.NewTemplateError(
 			name,
@@ -1064,7 +1122,7 @@ func (t Tpl) Execute(wr io.Writer, name string, data interface{}) error {
 		)
 	}
 
-	if err := t.tpl.ExecuteTemplate(wr, name, data); err != nil {
+	if err := tmpl.Execute(wr, data); err != nil {
 		return core.NewTemplateError(name, 0, "failed to execute template", err)
 	}
 
@@ -1081,9 +1139,13 @@ func MonthlyLegacy(cfg core.Config, tpls []string) (core.Modules, error) {
 	// Use tasks from config (already loaded and merged)
 	tasks := cfg.Tasks
 
+	// Capture "today" once for the whole run instead of per month module;
+	// this also keeps the highlighted day consistent across pages
+	today := cal.Day{Time: time.Now(), Cfg: &cfg}
+
 	// If we have months with tasks from CSV, use only those
 	if len(cfg.MonthsWithTasks) > 0 {
-		var modules core.Modules
+		modules := make(core.Modules, 0, len(cfg.MonthsWithTasks)+1)
 		if len(tasks) > 0 {
 			// Get CSV file list for TOC display
 			csvFiles, _ := getAllCSVFiles()
@@ -1093,8 +1155,16 @@ func MonthlyLegacy(cfg core.Config, tpls []string) (core.Modules, error) {
 
 		monthModules := make(core.Modules, 0, len(cfg.MonthsWithTasks))
 
+		// Consecutive entries usually share a year; build each calendar year
+		// once and reuse it instead of reconstructing it per month
+		years := make(map[int]*cal.Year)
+
 		for _, monthYear := range cfg.MonthsWithTasks {
-			year := cal.NewYear(cfg.WeekStart, monthYear.Year, &cfg)
+			year, ok := years[monthYear.Year]
+			if !ok {
+				year = cal.NewYear(cfg.WeekStart, monthYear.Year, &cfg)
+				years[monthYear.Year] = year
+			}
 
 			// Find the specific month in the year
 			var targetMonth *cal.Month
@@ -1136,7 +1206,7 @@ func MonthlyLegacy(cfg core.Config, tpls []string) (core.Modules, error) {
 					"Extra":        targetMonth.PrevNext().WithTopRightCorner(cfg.ClearTopRightCorner, cfg.Layout.Calendar.TaskKernSpacing),
 					"Large":        true,
 					"TableType":    "tabularx",
-					"Today":        cal.Day{Time: time.Now(), Cfg: &cfg},
+					"Today":        today,
 				},
 			})
 		}
@@ -1170,7 +1240,7 @@ func MonthlyLegacy(cfg core.Config, tpls []string) (core.Modules, error) {
 							"Extra":        month.PrevNext().WithTopRightCorner(cfg.ClearTopRightCorner, cfg.Layout.Calendar.TaskKernSpacing),
 							"Large":        true,
 							"TableType":    "tabularx",
-							"Today":        cal.Day{Time: time.Now(), Cfg: &cfg},
+							"Today":        today,
 						},
 					})
 				}
@@ -1336,6 +1406,69 @@ func autoDetectConfig(csvPath string) ([]string, error) {
 }
 
 // createTableOfContentsModule creates a table of contents module with links to all tasks
+// phaseSection groups related phases under a section heading in the TOC
+type phaseSection struct {
+	Name   string
+	Phases []string
+}
+
+// tocSections defines the hierarchical TOC structure. It is static, so the
+// section list and the derived order/lookup tables are built once at init
+// rather than on every TOC module creation.
+var tocSections = []phaseSection{
+	{
+		Name: "Setup \\& Proposal",
+		Phases: []string{
+			"Project Metadata",
+			"PhD Proposal",
+			"Committee Management",
+			"Microscope Setup",
+			"Laser System",
+		},
+	},
+	{
+		Name: "Research Aims",
+		Phases: []string{
+			"Aim 1 - AAV-based Vascular Imaging",
+			"Aim 2 - Dual-channel Imaging Platform",
+			"Aim 3 - Stroke Study & Analysis",
+			"Data Management & Analysis",
+		},
+	},
+	{
+		Name: "Publications \\& Tools",
+		Phases: []string{
+			"SLAVV-T Development",
+			"AR Platform Development",
+			"Research Paper",
+			"Methodology Paper",
+			"Manuscript Submissions",
+		},
+	},
+	{
+		Name: "Dissertation \\& Defense",
+		Phases: []string{
+			"Dissertation Writing",
+			"Committee Review & Defense",
+			"Final Submission & Graduation",
+		},
+	},
+}
+
+var (
+	tocPhaseOrder     []string
+	tocPhaseToSection = make(map[string]string)
+)
+
+func init() {
+	for _, section := range tocSections {
+		tocPhaseOrder = append(tocPhaseOrder, section.Phases...)
+		for _, phase := range section.Phases {
+			tocPhaseToSection[phase] = section.Name
+		}
+	}
+}
+
 func createTableOfContentsModule(cfg core.Config, tasks []core.Task, templateName string, csvFiles []string) core.Module {
 	// Group tasks by phase
 	phaseTasks := make(map[string][]core.Task)
@@ -1389,59 +1522,7 @@ func createTableOfContentsModule(cfg core.Config, tasks []core.Task, templateNam
 		phaseStats[phase] = stats
 	}
 
-	// Define hierarchical structure with sections and phases
-	type PhaseSection struct {
-		Name   string
-		Phases []string
-	}
-
-	sections := []PhaseSection{
-		{
-			Name: "Setup \\& Proposal",
-			Phases: []string{
-				"Project Metadata",
-				"PhD Proposal",
-				"Committee Management",
-				"Microscope Setup",
-				"Laser System",
-			},
-		},
-		{
-			Name: "Research Aims",
-			Phases: []string{
-				"Aim 1 - AAV-based Vascular Imaging",
-				"Aim 2 - Dual-channel Imaging Platform",
-				"Aim 3 - Stroke Study & Analysis",
-				"Data Management & Analysis",
-			},
-		},
-		{
-			Name: "Publications \\& Tools",
-			Phases: []string{
-				"SLAVV-T Development",
-				"AR Platform Development",
-				"Research Paper",
-				"Methodology Paper",
-				"Manuscript Submissions",
-			},
-		},
-		{
-			Name: "Dissertation \\& Defense",
-			Phases: []string{
-				"Dissertation Writing",
-				"Committee Review & Defense",
-				"Final Submission & Graduation",
-			},
-		},
-	}
-
-	// Build phase order from sections
-	phaseOrder := make([]string, 0)
-	for _, section := range sections {
-		phaseOrder = append(phaseOrder, section.Phases...)
-	}
-
-	// Get unique phases that exist in the data, ordered by phaseOrder
+	// Get unique phases that exist in the data, ordered by tocPhaseOrder
 	phases := make([]string, 0, len(phaseTasks))
 	phaseSet := make(map[string]bool)
 	for phase := range phaseTasks {
@@ -1449,7 +1530,7 @@ func createTableOfContentsModule(cfg core.Config, tasks []core.Task, templateNam
 	}
 
 	// Add phases in the defined order
-	for _, phase := range phaseOrder {
+	for _, phase := range tocPhaseOrder {
 		if phaseSet[phase] {
 			phases = append(phases, phase)
 			delete(phaseSet, phase)
@@ -1485,14 +1566,6 @@ func createTableOfContentsModule(cfg core.Config, tasks []core.Task, templateNam
 		taskDurations[task.ID] = fmt.Sprintf("%d", days)
 	}
 
-	// Create phase-to-section mapping
-	phaseToSection := make(map[string]string)
-	for _, section := range sections {
-		for _, phase := range section.Phases {
-			phaseToSection[phase] = section.Name
-		}
-	}
-
 	// Prepare CSV file info for display
 	csvFileNames := make([]string, len(csvFiles))
 	for i, csvFile := range csvFiles {
@@ -1507,7 +1580,7 @@ func createTableOfContentsModule(cfg core.Config, tasks []core.Task, templateNam
 			"PhaseOrder":     phases,
 			"PhaseNames":     phaseNames,
 			"PhaseColors":    phaseColors,
-			"PhaseToSection": phaseToSection,
+			"PhaseToSection": tocPhaseToSection,
 			"TaskDurations":  taskDurations,
 			"TotalTasks":     totalTasks,
 			"MilestoneCount": milestoneCount,
@@ -1522,14 +1595,17 @@ func createTableOfContentsModule(cfg core.Config, tasks []core.Task, templateNam
 // assignTasksToMonth assigns tasks to the appropriate days in a month
 func assignTasksToMonth(month *cal.Month, tasks []core.Task) {
 	// Convert data.Task to SpanningTask and apply to month
-	var spanningTasks []cal.SpanningTask
+	spanningTasks := make([]cal.SpanningTask, 0, len(tasks))
+
+	// Month bounds are loop-invariant; compute them once instead of per task
+	monthStart := time.Date(month.Year.Number, month.Month, 1, 0, 0, 0, 0, time.Local)
+	monthEnd := monthStart.AddDate(0, 1, -1)
+	overlapEnd := monthEnd.AddDate(0, 0, 1)
+	overlapStart := monthStart.AddDate(0, 0, -1)
 
 	for _, task := range tasks {
 		// Check if task overlaps with this month
-		monthStart := time.Date(month.Year.Number, month.Month, 1, 0, 0, 0, 0, time.Local)
-		monthEnd := monthStart.AddDate(0, 1, -1)
-
-		if task.StartDate.Before(monthEnd.AddDate(0, 0, 1)) && task.EndDate.After(monthStart.AddDate(0, 0, -1)) {
+		if task.StartDate.Before(overlapEnd) && task.EndDate.After(overlapStart) {
 			// Create spanning task directly from common.Task
 			// Rendering rules:
 			// - Start day: show a thin colored bar + a single concise text label.
@@ -1702,79 +1778,128 @@ func runConfigValidation(c *cli.Context) error {
 	return nil
 }
 
-// compileLaTeXToPDF compiles LaTeX files to PDF using XeLaTeX
-func compileLaTeXToPDF(cfg core.Config) error {
-	latexDir := filepath.Join(cfg.OutputDir, "latex")
-	pdfDir := filepath.Join(cfg.OutputDir, "pdfs")
-	auxDir := filepath.Join(cfg.OutputDir, "auxiliary")
+// compileLaTeXToPDF compiles the given root LaTeX file to PDF using XeLaTeX.
+// rootFile is the file name (within the latex output directory) of the root
+// document generated earlier in the run, so no directory scan is needed.
+// readLogTail returns up to limit bytes from the end of the file, for
+// surfacing the relevant part of a compile log in an error message
+func readLogTail(path string, limit int64) string {
+	f, err := os.Open(path)
+	if err != nil {
+		return ""
+	}
+	defer f.Close()
 
-	// Find the main LaTeX file (usually the first .tex file)
-	files, err := os.ReadDir(latexDir)
+	info, err := f.Stat()
 	if err != nil {
-		return fmt.Errorf("failed to read latex directory: %w", err)
+		return ""
 	}
 
-	var mainTexFile string
-	for _, file := range files {
-		if !file.IsDir() && strings.HasSuffix(file.Name(), ".tex") {
-			mainTexFile = filepath.Join(latexDir, file.Name())
-			break
-		}
+	offset := int64(0)
+	if info.Size() > limit {
+		offset = info.Size() - limit
 	}
 
-	if mainTexFile == "" {
-		return fmt.Errorf("no LaTeX file found in %s", latexDir)
+	buf := make([]byte, info.Size()-offset)
+	if _, err := f.ReadAt(buf, offset); err != nil && err != io.EOF {
+		return ""
 	}
+	return string(buf)
+}
 
-	// Change to latex directory for compilation
-	originalDir, err := os.Getwd()
+// latexContentHash hashes every .tex file in dir (names and contents) so a
+// compile can be skipped when none of the inputs changed since the last run
+func latexContentHash(dir string) (string, error) {
+	entries, err := os.ReadDir(dir)
 	if err != nil {
-		return fmt.Errorf("failed to get current directory: %w", err)
+		return "", err
 	}
-	defer os.Chdir(originalDir)
 
-	if err := os.Chdir(latexDir); err != nil {
-		return fmt.Errorf("failed to change to latex directory: %w", err)
+	h := sha256.New()
+	for _, entry := range entries {
+		if entry.IsDir() || filepath.Ext(entry.Name()) != texExtension {
+			continue
+		}
+		bts, err := os.ReadFile(filepath.Join(dir, entry.Name()))
+		if err != nil {
+			return "", err
+		}
+		h.Write([]byte(entry.Name()))
+		h.Write(bts)
 	}
 
-	// Run XeLaTeX compilation
-	cmd := exec.Command("xelatex", "-interaction=nonstopmode", filepath.Base(mainTexFile))
-	output, err := cmd.CombinedOutput()
-	if err != nil {
-		return fmt.Errorf("xelatex compilation failed: %w\nOutput: %s", err, string(output))
+	return hex.EncodeToString(h.Sum(nil)), nil
+}
+
+func compileLaTeXToPDF(cfg core.Config, rootFile string) error {
+	dirs := outputDirsFor(cfg)
+	latexDir := dirs.latex
+	pdfDir := dirs.pdfs
+	auxDir := dirs.auxiliary
+
+	mainTexFile := filepath.Join(latexDir, rootFile)
+	if _, err := os.Stat(mainTexFile); err != nil {
+		return fmt.Errorf("LaTeX root document %s not found: %w", mainTexFile, err)
 	}
 
-	// Move generated files to appropriate directories
 	baseName := strings.TrimSuffix(filepath.Base(mainTexFile), ".tex")
-	
-	// Ensure paths are absolute to avoid issues after chdir
-	absPdfDir, err := filepath.Abs(pdfDir)
+	destPDF := filepath.Join(pdfDir, baseName+".pdf")
+	hashFile := filepath.Join(auxDir, baseName+".texhash")
+
+	// Skip the compile entirely when the sources match the last successful
+	// run and the PDF is still in place; rebuilding identical .tex input
+	// through xelatex is by far the slowest part of a rerun
+	contentHash, hashErr := latexContentHash(latexDir)
+	if hashErr == nil {
+		if prev, err := os.ReadFile(hashFile); err == nil && string(prev) == contentHash {
+			if _, err := os.Stat(destPDF); err == nil {
+				logger.Info("LaTeX sources unchanged, reusing existing PDF: %s", destPDF)
+				return nil
+			}
+		}
+	}
+
+	// Run XeLaTeX with the latex directory as the command's working
+	// directory; the process-global working directory stays untouched.
+	// Console output streams to a log file rather than an in-memory buffer:
+	// verbose compiles emit megabytes, and only the tail matters on failure.
+	compileLog := filepath.Join(auxDir, baseName+".compile.log")
+	logFile, err := os.OpenFile(compileLog, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0o600)
 	if err != nil {
-		absPdfDir = pdfDir // Fallback to relative if Abs fails
+		return core.NewFileError(compileLog, "create", err)
 	}
+
+	// Point -output-directory at the auxiliary directory so the aux files
+	// land where they belong and only the PDF needs to move afterwards
 	absAuxDir, err := filepath.Abs(auxDir)
 	if err != nil {
-		absAuxDir = auxDir // Fallback to relative if Abs fails
+		absAuxDir = auxDir
 	}
-	
+
+	cmd := exec.Command("xelatex", "-interaction=nonstopmode",
+		"-output-directory", absAuxDir, filepath.Base(mainTexFile))
+	cmd.Dir = latexDir
+	cmd.Stdout = logFile
+	cmd.Stderr = logFile
+	runErr := cmd.Run()
+	logFile.Close()
+	if runErr != nil {
+		return fmt.Errorf("xelatex compilation failed: %w\nLog tail (full log: %s):\n%s",
+			runErr, compileLog, readLogTail(compileLog, 4096))
+	}
+
 	// Move PDF to pdfs directory
-	pdfFile := baseName + ".pdf"
+	pdfFile := filepath.Join(auxDir, baseName+".pdf")
 	if _, err := os.Stat(pdfFile); err == nil {
-		destPath := filepath.Join(absPdfDir, pdfFile)
-		if err := os.Rename(pdfFile, destPath); err != nil {
+		if err := os.Rename(pdfFile, destPDF); err != nil {
 			logger.Warn("Failed to move PDF file: %v", err)
 		}
 	}
 
-	// Move auxiliary files to auxiliary directory
-	auxFiles := []string{".aux", ".log", ".fdb_latexmk", ".fls", ".synctex.gz", ".tmp"}
-	for _, ext := range auxFiles {
-		auxFile := baseName + ext
-		if _, err := os.Stat(auxFile); err == nil {
-			destPath := filepath.Join(absAuxDir, auxFile)
-			if err := os.Rename(auxFile, destPath); err != nil {
-				logger.Warn("Failed to move auxiliary file %s: %v", auxFile, err)
-			}
+	// Record the source hash so an unchanged rerun can reuse the PDF
+	if hashErr == nil {
+		if err := os.WriteFile(hashFile, []byte(contentHash), 0o600); err != nil {
+			logger.Warn("Failed to record LaTeX source hash: %v", err)
 		}
 	}
 
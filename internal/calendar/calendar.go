@@ -13,6 +13,7 @@ import (
 	"sort"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"phd-dissertation-planner/internal/core"
@@ -66,18 +67,21 @@ func (d Day) Day(today, large interface{}) string {
 
 // renderLargeDay renders the day cell for large (monthly) view with tasks
 func (d Day) renderLargeDay(day string) string {
-	leftCell := d.buildDayNumberCell(day)
+	// Format the day reference once; both the hypertarget and the
+	// hyperlink wrapper need the same string
+	ref := d.ref()
+	leftCell := d.buildDayNumberCell(day, ref)
 
 	// Check for tasks using intelligent stacking
 	overlay := d.renderSpanningTaskOverlay()
 	if overlay != nil {
 		// Use spanning mode if any task spans more than 1 column
 		isSpanning := overlay.cols > 1
-		return d.buildTaskCell(leftCell, overlay.content, isSpanning, overlay.cols)
+		return d.buildTaskCell(leftCell, ref, overlay.content, isSpanning, overlay.cols)
 	}
 
 	// No tasks: just the day number
-	return d.buildSimpleDayCell(leftCell)
+	return d.buildSimpleDayCell(leftCell, ref)
 }
 
 // ref generates a reference string for the day
@@ -104,15 +108,31 @@ type cellConfig struct {
 	emergencyStretch string
 }
 
+// Resolved cellConfig per config pointer. The five fallback chains behind
+// it produce the same values for a given config, and getCellConfig runs for
+// every rendered day cell, so resolve them once per config instead.
+var cellConfigCache struct {
+	sync.Mutex
+	cfg  *core.Config
+	cell cellConfig
+}
+
 // getCellConfig extracts cell configuration from Day config with fallbacks
 func (d Day) getCellConfig() cellConfig {
-	return cellConfig{
-		dayNumberWidth:   d.Cfg.GetDayNumberWidth(),
-		dayContentMargin: d.Cfg.GetDayContentMargin(),
-		hyphenPenalty:    d.Cfg.GetHyphenPenalty(),
-		tolerance:        d.Cfg.GetTolerance(),
-		emergencyStretch: d.Cfg.GetEmergencyStretch(),
+	c := &cellConfigCache
+	c.Lock()
+	defer c.Unlock()
+	if c.cfg != d.Cfg {
+		c.cfg = d.Cfg
+		c.cell = cellConfig{
+			dayNumberWidth:   d.Cfg.GetDayNumberWidth(),
+			dayContentMargin: d.Cfg.GetDayContentMargin(),
+			hyphenPenalty:    d.Cfg.GetHyphenPenalty(),
+			tolerance:        d.Cfg.GetTolerance(),
+			emergencyStretch: d.Cfg.GetEmergencyStretch(),
+		}
 	}
+	return c.cell
 }
 
 // cellLayout defines the LaTeX layout parameters for a cell
@@ -124,20 +144,20 @@ type cellLayout struct {
 
 // buildDayNumberCell creates the basic day number cell with minimal padding and hypertarget
 // Uses minipage instead of tabular to eliminate auto padding
-func (d Day) buildDayNumberCell(day string) string {
+func (d Day) buildDayNumberCell(day, ref string) string {
 	cfg := d.getCellConfig()
 	// Create hypertarget for this day to enable hyperlink navigation
-	hypertarget := fmt.Sprintf(`\hypertarget{%s}{}`, d.ref())
-	return hypertarget + `\begin{minipage}[t]{` + cfg.dayNumberWidth + `}\centering{}` + day + `\end{minipage}`
+	return `\hypertarget{` + ref + `}{}` +
+		`\begin{minipage}[t]{` + cfg.dayNumberWidth + `}\centering{}` + day + `\end{minipage}`
 }
 
 // buildTaskCell creates a cell with either spanning tasks or regular tasks
-func (d Day) buildTaskCell(leftCell, content string, isSpanning bool, cols int) string {
+func (d Day) buildTaskCell(leftCell, ref, content string, isSpanning bool, cols int) string {
 	cfg := d.getCellConfig()
 	layout := d.determineCellLayout(content, isSpanning, cols, cfg)
 
 	inner := d.buildCellInner(leftCell, layout)
-	return d.wrapWithHyperlink(inner)
+	return wrapWithHyperlink(inner, ref)
 }
 
 // determineCellLayout determines the appropriate layout based on task type
@@ -173,12 +193,38 @@ func (d Day) buildVerticalStackLayout(content string) cellLayout {
 	}
 }
 
+// regularWrapperCache keeps the formatted wrapper prefix for the regular cell
+// layout. The prefix depends only on layout config, which is fixed for a run,
+// so it is formatted once instead of per day cell. Guarded by a mutex because
+// page modules render concurrently.
+var regularWrapperCache struct {
+	sync.Mutex
+	hyphenPenalty    int
+	tolerance        int
+	emergencyStretch string
+	prefix           string
+}
+
+func regularWrapperPrefix(cfg cellConfig) string {
+	c := &regularWrapperCache
+	c.Lock()
+	defer c.Unlock()
+	if c.prefix == "" || c.hyphenPenalty != cfg.hyphenPenalty ||
+		c.tolerance != cfg.tolerance || c.emergencyStretch != cfg.emergencyStretch {
+		c.hyphenPenalty = cfg.hyphenPenalty
+		c.tolerance = cfg.tolerance
+		c.emergencyStretch = cfg.emergencyStretch
+		c.prefix = fmt.Sprintf(`{\sloppy\hyphenpenalty=%d\tolerance=%d\emergencystretch=%s\footnotesize\raggedright `,
+			cfg.hyphenPenalty, cfg.tolerance, cfg.emergencyStretch)
+	}
+	return c.prefix
+}
+
 // buildRegularLayout creates layout for regular tasks with text flow
 func (d Day) buildRegularLayout(content string, cfg cellConfig) cellLayout {
 	width := `\dimexpr\linewidth - ` + cfg.dayContentMargin + `\relax`
 	spacing := `\hspace*{` + cfg.dayNumberWidth + `}`
-	contentWrapper := fmt.Sprintf(`{\sloppy\hyphenpenalty=%d\tolerance=%d\emergencystretch=%s\footnotesize\raggedright `,
-		cfg.hyphenPenalty, cfg.tolerance, cfg.emergencyStretch) + content + `}`
+	contentWrapper := regularWrapperPrefix(cfg) + content + `}`
 
 	return cellLayout{
 		width:          width,
@@ -199,14 +245,14 @@ func (d Day) buildCellInner(leftCell string, layout cellLayout) string {
 }
 
 // wrapWithHyperlink wraps content with a hyperlink to the day's reference
-func (d Day) wrapWithHyperlink(inner string) string {
-	return `\hyperlink{` + d.ref() + `}{` + inner + `}`
+func wrapWithHyperlink(inner, ref string) string {
+	return `\hyperlink{` + ref + `}{` + inner + `}`
 }
 
 // buildSimpleDayCell creates a simple day cell without tasks
-func (d Day) buildSimpleDayCell(leftCell string) string {
+func (d Day) buildSimpleDayCell(leftCell, ref string) string {
 	inner := `{\begingroup\makebox[0pt][l]{` + leftCell + `}\endgroup}`
-	return d.wrapWithHyperlink(inner)
+	return wrapWithHyperlink(inner, ref)
 }
 
 // ============================================================================
@@ -274,8 +320,9 @@ func (d Day) renderSpanningTaskOverlay() *TaskOverlay {
 		// Optimization: Use pre-calculated escaped name
 		taskName := task.EscapedName
 		// UX/A11y: Use accessible star icon for milestones
-		// Check both the boolean flag and legacy description prefix for backward compatibility
-		if task.IsMilestone || d.isMilestoneSpanningTask(task) {
+		// IsMilestone already folds in the legacy description prefix (see
+		// ApplySpanningTasksToMonth), so a single flag check suffices here
+		if task.IsMilestone {
 			taskName = `\BeginAccSupp{method=pdfstringdef,unicode,ActualText={Milestone: } }★\EndAccSupp{} ` + taskName
 		}
 
@@ -285,7 +332,8 @@ func (d Day) renderSpanningTaskOverlay() *TaskOverlay {
 			objective = task.EscapedDescription
 		}
 
-		taskColor := core.HexToRGB(task.Color)
+		// Optimization: Use pre-calculated RGB color
+		taskColor := task.ColorRGB
 		if taskColor == "" {
 			taskColor = core.Defaults.DefaultTaskColor
 		}
@@ -472,16 +520,25 @@ func (d Day) sortTasksInPlace(tasks []*SpanningTask) {
 	})
 }
 
-// isMilestoneSpanningTask checks if a task is a milestone
-func (d Day) isMilestoneSpanningTask(task *SpanningTask) bool {
-	return strings.HasPrefix(strings.ToUpper(strings.TrimSpace(task.Description)), "MILESTONE:")
+// milestonePrefix is the legacy marker some CSVs carry in the description
+const milestonePrefix = "MILESTONE:"
+
+// isMilestoneDescription checks the legacy "MILESTONE:" description prefix.
+// EqualFold on the prefix slice avoids upper-casing the whole description
+// just to inspect its first few characters.
+func isMilestoneDescription(description string) bool {
+	trimmed := strings.TrimSpace(description)
+	return len(trimmed) >= len(milestonePrefix) &&
+		strings.EqualFold(trimmed[:len(milestonePrefix)], milestonePrefix)
 }
 
 // ============================================================================
 // HELPER FUNCTIONS - LATEX UTILITIES
 // ============================================================================
 
-// latexReplacer is a pre-compiled replacer for LaTeX special characters
+// latexReplacer is a pre-compiled replacer for LaTeX special characters.
+// This is the single escaping table for the whole code base; app.EscapeLatex
+// delegates here so both packages stay in sync.
 var latexReplacer = strings.NewReplacer(
 	"\\", "\\textbackslash{}",
 	"{", "\\{",
@@ -493,10 +550,21 @@ var latexReplacer = strings.NewReplacer(
 	"^", "\\textasciicircum{}",
 	"_", "\\_",
 	"~", "\\textasciitilde{}",
+	"[", "{[}",
+	"]", "{]}",
 )
 
+// latexSpecialChars lists every character the replacer rewrites, used for the
+// fast-path scan below.
+const latexSpecialChars = "\\{}$&%#^_~[]"
+
 // EscapeLatexSpecialChars replaces special LaTeX characters with their escaped versions
 func EscapeLatexSpecialChars(text string) string {
+	// Most task names and descriptions contain no LaTeX specials; a single
+	// scan lets those strings pass through without any allocation.
+	if !strings.ContainsAny(text, latexSpecialChars) {
+		return text
+	}
 	// Optimize: Use pre-compiled replacer for significantly better performance
 	// and fewer allocations compared to chained strings.ReplaceAll
 	return latexReplacer.Replace(text)
@@ -923,18 +991,16 @@ func (m *Month) GetTaskColorsByPhase() []PhaseGroup {
 
 	for _, phaseName := range phaseOrder {
 		if color, exists := phaseMap[phaseName]; exists {
+			// Escape once per unique phase and reuse for both legend slots
+			escapedName := EscapeLatexSpecialChars(phaseName)
 			phase := PhaseGroup{
-				PhaseNumber: "",  // No longer using phase numbers
-				PhaseName:   EscapeLatexSpecialChars(phaseName),
+				PhaseNumber: "", // No longer using phase numbers
+				PhaseName:   escapedName,
 			}
 
 			// Add the phase as a "subphase" for consistency with template
 			phase.SubPhases = append(phase.SubPhases, SubPhaseLegendItem{
-				// Optimization: We could use task.EscapedPhase here, but we are iterating unique phases.
-				// Since we don't have the task object here (we are iterating phaseOrder), we must escape again.
-				// However, we can optimize by storing escaped name in the map or just doing it here.
-				// Given the low cardinality of phases, this is not a hot path.
-				Name:  EscapeLatexSpecialChars(phaseName),
+				Name:  escapedName,
 				Color: color,
 			})
 
@@ -945,16 +1011,18 @@ func (m *Month) GetTaskColorsByPhase() []PhaseGroup {
 	return phases
 }
 
+// phaseDescriptions maps phase numbers to their display names; defined once
+// instead of being rebuilt on every lookup
+var phaseDescriptions = map[string]string{
+	"1": "Phase 1: Proposal \\& Setup",
+	"2": "Phase 2: Research \\& Data Collection",
+	"3": "Phase 3: Publications",
+	"4": "Phase 4: Dissertation",
+}
+
 // GetPhaseDescription returns a human-readable phase description
 func GetPhaseDescription(phaseNum string) string {
-	descriptions := map[string]string{
-		"1": "Phase 1: Proposal \\& Setup",
-		"2": "Phase 2: Research \\& Data Collection",
-		"3": "Phase 3: Publications",
-		"4": "Phase 4: Dissertation",
-	}
-
-	if desc, exists := descriptions[phaseNum]; exists {
+	if desc, exists := phaseDescriptions[phaseNum]; exists {
 		return desc
 	}
 	return "Phase " + phaseNum
@@ -1073,6 +1141,9 @@ type SpanningTask struct {
 	EscapedDescription string
 	EscapedCategory    string
 	EscapedPhase       string
+
+	// Memoized RGB form of Color for LaTeX rendering
+	ColorRGB string
 }
 
 // CreateSpanningTask creates a new spanning task from basic task data
@@ -1126,6 +1197,18 @@ func ApplySpanningTasksToMonth(month *Month, tasks []SpanningTask) {
 		localTasks[i].EscapedDescription = EscapeLatexSpecialChars(localTasks[i].Description)
 		localTasks[i].EscapedCategory = EscapeLatexSpecialChars(localTasks[i].Category)
 		localTasks[i].EscapedPhase = EscapeLatexSpecialChars(localTasks[i].Phase)
+
+		// Pre-convert the task color to RGB once instead of on every render
+		localTasks[i].ColorRGB = core.HexToRGB(localTasks[i].Color)
+		if localTasks[i].ColorRGB == "" {
+			localTasks[i].ColorRGB = core.Defaults.DefaultTaskColor
+		}
+
+		// Fold the legacy "MILESTONE:" description prefix into the flag once,
+		// so rendering never re-scans the raw description per day
+		if !localTasks[i].IsMilestone && isMilestoneDescription(localTasks[i].Description) {
+			localTasks[i].IsMilestone = true
+		}
 	}
 
 	// 2. Sort tasks by StartDate
@@ -16,6 +16,7 @@ import (
 	"os"
 	"strconv"
 	"strings"
+	"sync"
 )
 
 // Color codes for terminal output
@@ -71,8 +72,23 @@ func IsInteractive() bool {
 	return false
 }
 
-// colorEnabled checks if colors should be used based on environment and terminal support
+// colorEnabled reports whether colors should be used based on environment and
+// terminal support. The environment and TTY status don't change mid-process,
+// so the detection runs once and every colorize call afterwards is a cached read.
+var (
+	colorEnabledOnce   sync.Once
+	colorEnabledResult bool
+)
+
 func colorEnabled() bool {
+	colorEnabledOnce.Do(func() {
+		colorEnabledResult = detectColorEnabled()
+	})
+	return colorEnabledResult
+}
+
+// detectColorEnabled performs the actual environment and terminal checks
+func detectColorEnabled() bool {
 	// Check if NO_COLOR environment variable is set
 	if noColor := os.Getenv("NO_COLOR"); noColor != "" {
 		return false
@@ -150,10 +166,36 @@ func MagentaText(text string) string {
 	return colorize(Magenta, text)
 }
 
+// Conversion cache for HexToRGB. Documents reuse a handful of category
+// colors across hundreds of task occurrences, so memoizing the parse and
+// format work turns repeat conversions into a map hit.
+var (
+	hexToRGBMu    sync.RWMutex
+	hexToRGBCache = make(map[string]string)
+)
+
 // HexToRGB converts a hex color string to RGB format for LaTeX compatibility.
 // Accepts hex colors with or without the # prefix.
 // Returns "128,128,128" (gray) for invalid hex strings.
 func HexToRGB(hex string) string {
+	hexToRGBMu.RLock()
+	rgb, ok := hexToRGBCache[hex]
+	hexToRGBMu.RUnlock()
+	if ok {
+		return rgb
+	}
+
+	rgb = hexToRGB(hex)
+
+	hexToRGBMu.Lock()
+	hexToRGBCache[hex] = rgb
+	hexToRGBMu.Unlock()
+
+	return rgb
+}
+
+// hexToRGB performs the actual hex parsing and RGB formatting
+func hexToRGB(hex string) string {
 	// Remove # prefix if present
 	hex = strings.TrimPrefix(hex, "#")
 
@@ -54,6 +54,7 @@ import (
 	"fmt"
 	"os"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/caarlos0/env/v6"
@@ -411,6 +412,30 @@ func FilterUniqueModules(array []Module) []Module {
 // NewConfig creates a new configuration from config files and environment variables
 // Starts with sensible defaults and overlays file and environment configuration
 func NewConfig(pathConfigs ...string) (Config, error) {
+	return newConfig(pathConfigs, true)
+}
+
+// NewConfigWithTasks loads configuration like NewConfig but takes tasks that
+// have already been parsed, deriving the date range and months from them
+// instead of re-reading the CSV file.
+func NewConfigWithTasks(tasks []Task, pathConfigs ...string) (Config, error) {
+	cfg, err := newConfig(pathConfigs, false)
+	if err != nil {
+		return cfg, err
+	}
+
+	cfg.Tasks = tasks
+	if len(tasks) > 0 {
+		dateRange := CalculateDateRange(tasks)
+		cfg.StartYear = dateRange.Earliest.Year()
+		cfg.EndYear = dateRange.Latest.Year()
+		cfg.MonthsWithTasks = GetMonthsWithTasks(tasks, dateRange)
+	}
+
+	return cfg, nil
+}
+
+func newConfig(pathConfigs []string, deriveDatesFromCSV bool) (Config, error) {
 	var (
 		bts []byte
 		err error
@@ -466,7 +491,7 @@ func NewConfig(pathConfigs ...string) (Config, error) {
 	}
 
 	// If CSV file is provided, determine date range dynamically
-	if cfg.CSVFilePath != "" {
+	if deriveDatesFromCSV && cfg.CSVFilePath != "" {
 		if err := cfg.setDateRangeFromCSV(); err != nil {
 			return cfg, fmt.Errorf("failed to set date range from CSV: %w", err)
 		}
@@ -562,17 +587,32 @@ func (cfg *Config) setDateRangeFromCSV() error {
 	return nil
 }
 
+// Algorithmic colors for the predefined categories, computed once. The
+// category set is fixed, so hashing the names and converting to RGB on
+// every config load (initial load plus each hot reload) is wasted work.
+var (
+	algorithmicColorsOnce sync.Once
+	algorithmicColors     AlgorithmicColors
+)
+
+func defaultAlgorithmicColors() AlgorithmicColors {
+	algorithmicColorsOnce.Do(func() {
+		algorithmicColors = AlgorithmicColors{
+			Proposal:     HexToRGB(GenerateCategoryColor("PROPOSAL")),
+			Laser:        HexToRGB(GenerateCategoryColor("LASER")),
+			Imaging:      HexToRGB(GenerateCategoryColor("IMAGING")),
+			Admin:        HexToRGB(GenerateCategoryColor("ADMIN")),
+			Dissertation: HexToRGB(GenerateCategoryColor("DISSERTATION")),
+			Research:     HexToRGB(GenerateCategoryColor("RESEARCH")),
+			Publication:  HexToRGB(GenerateCategoryColor("PUBLICATION")),
+		}
+	})
+	return algorithmicColors
+}
+
 // setAlgorithmicColors sets the algorithmic colors for predefined categories
 func (cfg *Config) setAlgorithmicColors() {
-	cfg.Layout.AlgorithmicColors = AlgorithmicColors{
-		Proposal:     HexToRGB(GenerateCategoryColor("PROPOSAL")),
-		Laser:        HexToRGB(GenerateCategoryColor("LASER")),
-		Imaging:      HexToRGB(GenerateCategoryColor("IMAGING")),
-		Admin:        HexToRGB(GenerateCategoryColor("ADMIN")),
-		Dissertation: HexToRGB(GenerateCategoryColor("DISSERTATION")),
-		Research:     HexToRGB(GenerateCategoryColor("RESEARCH")),
-		Publication:  HexToRGB(GenerateCategoryColor("PUBLICATION")),
-	}
+	cfg.Layout.AlgorithmicColors = defaultAlgorithmicColors()
 }
 
 // getStringWithDefault returns the config value if it's not empty, otherwise the default
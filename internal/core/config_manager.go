@@ -37,6 +37,12 @@ type ConfigManager struct {
 
 	// Environment variables registry
 	envVars map[string]EnvVarDefinition
+
+	// Modification times of the config files behind the current config.
+	// Hot reload fires once per write event and editors commonly emit
+	// several, so a reload whose inputs are unchanged since the last
+	// successful load can return the cached config without re-parsing.
+	fileStamps map[string]time.Time
 }
 
 // EnvVarDefinition defines an environment variable with validation rules
@@ -85,6 +91,15 @@ func (cm *ConfigManager) Load(paths []string, preset string) (*Config, error) {
 		paths = append(presetPaths, paths...)
 	}
 
+	// Skip the re-parse when every config file is unchanged since the
+	// last successful load
+	stamps := configFileStamps(paths)
+	if cm.fileStamps != nil && stampsEqual(cm.fileStamps, stamps) {
+		cm.logger.Debug("Configuration files unchanged, reusing parsed config")
+		cached := cm.config
+		return &cached, nil
+	}
+
 	// Load configuration from files
 	config, err := cm.loadFromFiles(paths)
 	if err != nil {
@@ -105,9 +120,36 @@ func (cm *ConfigManager) Load(paths []string, preset string) (*Config, error) {
 	cm.applyDefaults(config)
 
 	cm.config = *config
+	cm.fileStamps = stamps
 	return config, nil
 }
 
+// configFileStamps records the modification time of each existing config file
+func configFileStamps(paths []string) map[string]time.Time {
+	stamps := make(map[string]time.Time, len(paths))
+	for _, path := range paths {
+		if info, err := os.Stat(path); err == nil {
+			stamps[path] = info.ModTime()
+		}
+	}
+	return stamps
+}
+
+// stampsEqual reports whether two file-stamp snapshots cover the same files
+// with the same modification times
+func stampsEqual(a, b map[string]time.Time) bool {
+	if len(a) != len(b) {
+		return false
+	}
+	for path, mtime := range a {
+		other, ok := b[path]
+		if !ok || !other.Equal(mtime) {
+			return false
+		}
+	}
+	return true
+}
+
 // ValidateAtStartup performs comprehensive validation at application startup
 func (cm *ConfigManager) ValidateAtStartup(config *Config) error {
 	cm.logger.Info("Performing startup configuration validation...")
@@ -54,15 +54,16 @@ type ConfigError struct {
 }
 
 func (e *ConfigError) Error() string {
-	msg := fmt.Sprintf("config error in %s", e.File)
+	var msg strings.Builder
+	fmt.Fprintf(&msg, "config error in %s", e.File)
 	if e.Field != "" {
-		msg += fmt.Sprintf(", field '%s'", e.Field)
+		fmt.Fprintf(&msg, ", field '%s'", e.Field)
 	}
-	msg += fmt.Sprintf(": %s", e.Message)
+	fmt.Fprintf(&msg, ": %s", e.Message)
 	if e.Err != nil {
-		msg += fmt.Sprintf(" (%v)", e.Err)
+		fmt.Fprintf(&msg, " (%v)", e.Err)
 	}
-	return msg
+	return msg.String()
 }
 
 func (e *ConfigError) Unwrap() error {
@@ -112,17 +113,17 @@ type TemplateError struct {
 }
 
 func (e *TemplateError) Error() string {
-	var msg string
+	var msg strings.Builder
 	if e.Line > 0 {
-		msg = fmt.Sprintf("template error in %s at line %d: %s", e.Template, e.Line, e.Message)
+		fmt.Fprintf(&msg, "template error in %s at line %d: %s", e.Template, e.Line, e.Message)
 	} else {
-		msg = fmt.Sprintf("template error in %s: %s", e.Template, e.Message)
+		fmt.Fprintf(&msg, "template error in %s: %s", e.Template, e.Message)
 	}
 
 	if e.Err != nil {
-		msg += fmt.Sprintf("\n  Cause: %v", e.Err)
+		fmt.Fprintf(&msg, "\n  Cause: %v", e.Err)
 	}
-	return msg
+	return msg.String()
 }
 
 func (e *TemplateError) Unwrap() error {
@@ -149,19 +150,19 @@ type DataError struct {
 }
 
 func (e *DataError) Error() string {
-	msg := ""
+	var msg strings.Builder
 	if e.Row > 0 && e.Column != "" {
-		msg = fmt.Sprintf("data error in %s at row %d, column '%s': %s", e.Source, e.Row, e.Column, e.Message)
+		fmt.Fprintf(&msg, "data error in %s at row %d, column '%s': %s", e.Source, e.Row, e.Column, e.Message)
 	} else if e.Row > 0 {
-		msg = fmt.Sprintf("data error in %s at row %d: %s", e.Source, e.Row, e.Message)
+		fmt.Fprintf(&msg, "data error in %s at row %d: %s", e.Source, e.Row, e.Message)
 	} else {
-		msg = fmt.Sprintf("data error in %s: %s", e.Source, e.Message)
+		fmt.Fprintf(&msg, "data error in %s: %s", e.Source, e.Message)
 	}
 
 	if e.Err != nil {
-		msg += fmt.Sprintf(" (%v)", e.Err)
+		fmt.Fprintf(&msg, " (%v)", e.Err)
 	}
-	return msg
+	return msg.String()
 }
 
 func (e *DataError) Unwrap() error {
@@ -116,11 +116,28 @@ type contextKey struct{}
 var globalLogger *Logger
 var globalLoggerOnce sync.Once
 
+// Environment-derived logger settings, resolved once. The environment does
+// not change mid-process, and caching the writer means every logger shares a
+// single handle to PLANNER_LOG_FILE instead of reopening the file per logger.
+var (
+	loggerSettingsOnce sync.Once
+	cachedLogLevel     int
+	cachedLogFormat    LogFormat
+	cachedLogWriter    io.Writer
+)
+
+func loggerSettings() (level int, format LogFormat, writer io.Writer) {
+	loggerSettingsOnce.Do(func() {
+		cachedLogLevel = parseLogLevel(getLogLevelString())
+		cachedLogFormat = parseLogFormat(os.Getenv(envPlannerLogFormat))
+		cachedLogWriter = getLogWriter()
+	})
+	return cachedLogLevel, cachedLogFormat, cachedLogWriter
+}
+
 // NewLogger creates a new logger with the specified prefix
 func NewLogger(prefix string) *Logger {
-	level := parseLogLevel(getLogLevelString())
-	format := parseLogFormat(os.Getenv(envPlannerLogFormat))
-	writer := getLogWriter()
+	level, format, writer := loggerSettings()
 
 	return &Logger{
 		Writer: writer,
@@ -196,9 +213,12 @@ func parseLogFormat(format string) LogFormat {
 	}
 }
 
-// IsSilent returns true if logging is suppressed
+// IsSilent returns true if logging is suppressed. The answer comes from the
+// cached logger settings, so callers in per-page loops pay a single Once read
+// rather than re-parsing the environment on every call.
 func IsSilent() bool {
-	return parseLogLevel(getLogLevelString()) == LogLevelSilent
+	level, _, _ := loggerSettings()
+	return level == LogLevelSilent
 }
 
 // WithField creates a new logger with an additional field
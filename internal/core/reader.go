@@ -1,6 +1,7 @@
 package core
 
 import (
+	"bufio"
 	"encoding/csv"
 	"fmt"
 	"io"
@@ -81,6 +82,35 @@ var supportedDateFormats = []string{
 	DateFormatSpace,
 }
 
+// Format candidates by input shape. Selecting the layouts that match the
+// separator up front lets a well-formed date parse on the first attempt
+// instead of failing through the table; the full table stays the fallback.
+var (
+	dateFormatsSpace     = []string{DateFormatSpace}
+	dateFormatsDash      = []string{DateFormatISO}
+	dateFormatsDot       = []string{DateFormatDot}
+	dateFormatsYearSlash = []string{DateFormatSlash}
+	dateFormatsDaySlash  = []string{DateFormatUS, DateFormatEU}
+)
+
+// dateFormatCandidates narrows the layouts to try based on the separator and
+// shape of the cleaned input
+func dateFormatCandidates(dateStr string) []string {
+	switch {
+	case strings.ContainsRune(dateStr, ' '):
+		return dateFormatsSpace
+	case strings.ContainsRune(dateStr, '-'):
+		return dateFormatsDash
+	case strings.ContainsRune(dateStr, '.'):
+		return dateFormatsDot
+	case strings.IndexByte(dateStr, '/') == 4:
+		return dateFormatsYearSlash
+	case strings.ContainsRune(dateStr, '/'):
+		return dateFormatsDaySlash
+	}
+	return supportedDateFormats
+}
+
 // Reader handles reading and parsing CSV task data
 type Reader struct {
 	FilePath    string
@@ -89,6 +119,9 @@ type Reader struct {
 	strictMode  bool             // If true, fail on any parsing error
 	skipInvalid bool             // If true, skip invalid rows instead of failing
 	maxMemoryMB int              // Maximum memory usage in MB for large files
+
+	dateCache      map[string]time.Time // Successful parseDate results keyed by cleaned input
+	lastDateFormat string               // Format that parsed the previous date, tried first
 }
 
 // ReaderOptions configures the CSV reader behavior
@@ -163,28 +196,73 @@ func (r *Reader) parseDate(dateStr string) (time.Time, error) {
 	// Clean the date string
 	dateStr = strings.TrimSpace(dateStr)
 
-	// Try each supported format
-	for _, format := range supportedDateFormats {
-		if parsed, err := time.Parse(format, dateStr); err == nil {
+	// Repeated dates (shared deadlines, same-day milestones) are common in
+	// task CSVs, so successful parses are memoized per reader
+	if cached, ok := r.dateCache[dateStr]; ok {
+		return cached, nil
+	}
+
+	// Dates within one file almost always share a format, so try the format
+	// that parsed the previous value before walking the full table
+	if r.lastDateFormat != "" {
+		if parsed, err := time.Parse(r.lastDateFormat, dateStr); err == nil {
+			r.cacheDate(dateStr, parsed)
 			return parsed, nil
 		}
 	}
 
+	// Try the formats matching the input's shape first, then the full table
+	if parsed, ok := r.tryFormats(dateStr, dateFormatCandidates(dateStr)); ok {
+		return parsed, nil
+	}
+	if parsed, ok := r.tryFormats(dateStr, supportedDateFormats); ok {
+		return parsed, nil
+	}
+
 	return time.Time{}, NewParseError(0, "Date", dateStr,
 		fmt.Sprintf("unable to parse with any supported format (tried: %v)", supportedDateFormats), nil)
 }
 
+// tryFormats attempts each layout in order, recording the first success
+func (r *Reader) tryFormats(dateStr string, formats []string) (time.Time, bool) {
+	for _, format := range formats {
+		if format == r.lastDateFormat {
+			continue // Already tried before the table walk
+		}
+		if parsed, err := time.Parse(format, dateStr); err == nil {
+			r.lastDateFormat = format
+			r.cacheDate(dateStr, parsed)
+			return parsed, true
+		}
+	}
+	return time.Time{}, false
+}
+
+// cacheDate records a successful parse, initializing the cache on first use
+func (r *Reader) cacheDate(dateStr string, parsed time.Time) {
+	if r.dateCache == nil {
+		r.dateCache = make(map[string]time.Time)
+	}
+	r.dateCache[dateStr] = parsed
+}
+
+// milestoneKeywords are matched case-insensitively against task names and
+// descriptions when the CSV has no explicit milestone column value
+var milestoneKeywords = []string{"milestone", "deadline", "due", "complete", "finish", "submit", "deliver"}
+
 // isMilestoneTask determines if a task is a milestone based on its name or description
 func (r *Reader) isMilestoneTask(name, description string) bool {
-	text := strings.ToLower(name + " " + description)
-	milestoneKeywords := []string{"milestone", "deadline", "due", "complete", "finish", "submit", "deliver"}
+	return containsMilestoneKeyword(name) || containsMilestoneKeyword(description)
+}
 
+// containsMilestoneKeyword reports whether the text mentions any milestone keyword
+func containsMilestoneKeyword(text string) bool {
+	text = strings.ToLower(text)
 	for _, keyword := range milestoneKeywords {
 		if strings.Contains(text, keyword) {
 			return true
 		}
 	}
-
 	return false
 }
 
@@ -284,11 +362,15 @@ func (r *Reader) checkFileSize(fileInfo os.FileInfo) {
 	}
 }
 
-// createCSVReader creates a configured CSV reader
+// createCSVReader creates a configured CSV reader backed by a large read
+// buffer for better sequential throughput on big files
 func (r *Reader) createCSVReader(file *os.File) *csv.Reader {
-	reader := csv.NewReader(file)
+	reader := csv.NewReader(bufio.NewReaderSize(file, 64*1024))
 	reader.FieldsPerRecord = -1    // Allow variable number of fields
 	reader.TrimLeadingSpace = true // Trim leading spaces
+	// Each record is converted to a Task before the next Read, so the
+	// record slice can be reused instead of reallocated per row
+	reader.ReuseRecord = true
 	return reader
 }
 
@@ -324,8 +406,9 @@ func (r *Reader) parseAllRecords(reader *csv.Reader, fieldIndex map[string]int)
 			break
 		}
 		if err != nil {
-			parseErrors = append(parseErrors, fmt.Errorf("row %d: %w", rowNum, err))
-			r.addError(fmt.Errorf("row %d: %w", rowNum, err))
+			rowErr := fmt.Errorf("row %d: %w", rowNum, err)
+			parseErrors = append(parseErrors, rowErr)
+			r.addError(rowErr)
 			break
 		}
 
@@ -387,6 +470,23 @@ func (r *Reader) logParsingSummary(tasks []Task, _ []error) {
 	}
 }
 
+// Pre-normalized column names matching the lower-cased field index. Keeping
+// the constants in the index's own form means the per-row extractor does a
+// plain map lookup instead of normalizing the name for every field access.
+const (
+	colTaskID       = "task id"
+	colTask         = "task"
+	colObjective    = "objective"
+	colMilestone    = "milestone"
+	colPhase        = "phase"
+	colStatus       = "status"
+	colAssignee     = "assignee"
+	colParentTaskID = "parent task id"
+	colDependencies = "dependencies"
+	colStartDate    = "start date"
+	colEndDate      = "end date"
+)
+
 // fieldExtractor helps extract fields from CSV records with case-insensitive matching
 type fieldExtractor struct {
 	record     []string
@@ -401,10 +501,10 @@ func newFieldExtractor(record []string, fieldIndex map[string]int) *fieldExtract
 	}
 }
 
-// get retrieves a field value by name (case-insensitive)
+// get retrieves a field value by its pre-normalized (lower-case) column name;
+// header normalization happens once in createFieldIndexMap
 func (fe *fieldExtractor) get(fieldName string) string {
-	normalizedField := strings.ToLower(strings.TrimSpace(fieldName))
-	if index, exists := fe.fieldIndex[normalizedField]; exists && index < len(fe.record) {
+	if index, exists := fe.fieldIndex[fieldName]; exists && index < len(fe.record) {
 		return strings.TrimSpace(fe.record[index])
 	}
 	return ""
@@ -426,8 +526,8 @@ func (fe *fieldExtractor) getList(fieldName string) []string {
 		return nil
 	}
 
-	var result []string
 	parts := strings.Split(value, ",")
+	result := make([]string, 0, len(parts))
 	for _, part := range parts {
 		trimmed := strings.TrimSpace(part)
 		if trimmed != "" {
@@ -452,7 +552,7 @@ func (r *Reader) parseTask(record []string, fieldIndex map[string]int, rowNum in
 	r.extractStatusFields(&task, extractor)
 
 	// Extract dependencies
-	task.Dependencies = extractor.getList("Dependencies")
+	task.Dependencies = extractor.getList(colDependencies)
 
 	// Parse dates
 	if err := r.extractDateFields(&task, extractor, rowNum); err != nil {
@@ -469,15 +569,15 @@ func (r *Reader) parseTask(record []string, fieldIndex map[string]int, rowNum in
 
 // extractBasicFields extracts ID, name, description, and milestone status
 func (r *Reader) extractBasicFields(task *Task, extractor *fieldExtractor) {
-	task.ID = extractor.get("Task ID")
+	task.ID = extractor.get(colTaskID)
 	if task.ID == "" {
-		task.ID = extractor.get("Task") // Fallback to name if no ID
+		task.ID = extractor.get(colTask) // Fallback to name if no ID
 	}
-	task.Name = extractor.get("Task")
-	task.Description = extractor.get("Objective")
+	task.Name = extractor.get(colTask)
+	task.Description = extractor.get(colObjective)
 
 	// Extract milestone status from CSV column or detect from content
-	milestoneValue := extractor.get("Milestone")
+	milestoneValue := extractor.get(colMilestone)
 	if milestoneValue != "" && strings.ToLower(milestoneValue) != "false" {
 		task.IsMilestone = true
 	} else {
@@ -489,7 +589,7 @@ func (r *Reader) extractBasicFields(task *Task, extractor *fieldExtractor) {
 // extractPhaseFields extracts phase and category information
 func (r *Reader) extractPhaseFields(task *Task, extractor *fieldExtractor) {
 	// Phase now contains the combined format directly from CSV
-	task.Phase = extractor.get("Phase")
+	task.Phase = extractor.get(colPhase)
 
 	// Use phase as category for better granularity
 	task.Category = task.Phase
@@ -497,14 +597,14 @@ func (r *Reader) extractPhaseFields(task *Task, extractor *fieldExtractor) {
 
 // extractStatusFields extracts status and assignee
 func (r *Reader) extractStatusFields(task *Task, extractor *fieldExtractor) {
-	task.Status = extractor.getWithDefault("Status", "Planned")
-	task.Assignee = extractor.get("Assignee")
-	task.ParentID = extractor.get("Parent Task ID")
+	task.Status = extractor.getWithDefault(colStatus, "Planned")
+	task.Assignee = extractor.get(colAssignee)
+	task.ParentID = extractor.get(colParentTaskID)
 }
 
 // extractDateFields parses date fields from the extractor
 func (r *Reader) extractDateFields(task *Task, extractor *fieldExtractor, rowNum int) error {
-	startDateStr := extractor.get("Start Date")
+	startDateStr := extractor.get(colStartDate)
 	if startDateStr != "" {
 		startDate, err := r.parseDate(startDateStr)
 		if err != nil {
@@ -513,7 +613,7 @@ func (r *Reader) extractDateFields(task *Task, extractor *fieldExtractor, rowNum
 		task.StartDate = startDate
 	}
 
-	endDateStr := extractor.get("End Date")
+	endDateStr := extractor.get(colEndDate)
 	if endDateStr != "" {
 		endDate, err := r.parseDate(endDateStr)
 		if err != nil {
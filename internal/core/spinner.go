@@ -39,15 +39,18 @@ func (s *Spinner) Start() {
 	go func() {
 		defer s.wg.Done()
 		chars := []string{"⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"}
+		// Use a ticker instead of sleeping in the loop so Stop() returns
+		// immediately rather than waiting out the current frame delay
+		ticker := time.NewTicker(100 * time.Millisecond)
+		defer ticker.Stop()
 		i := 0
 		for {
+			fmt.Print(ClearLine())
+			fmt.Printf("%s %s", CyanText(chars[i]), Info(s.message))
 			select {
 			case <-s.stop:
 				return
-			default:
-				fmt.Print(ClearLine())
-				fmt.Printf("%s %s", CyanText(chars[i]), Info(s.message))
-				time.Sleep(100 * time.Millisecond)
+			case <-ticker.C:
 				i = (i + 1) % len(chars)
 			}
 		}
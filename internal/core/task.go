@@ -2,7 +2,9 @@ package core
 
 import (
 	"fmt"
+	"sort"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -94,6 +96,13 @@ var (
 	}
 )
 
+// categoryColorCache memoizes GenerateCategoryColor results; timelines use a
+// handful of categories but the lookup runs for every task and legend entry.
+var (
+	categoryColorMu    sync.RWMutex
+	categoryColorCache = make(map[string]string)
+)
+
 // GenerateCategoryColor creates a consistent, visually distinct color based on the category name
 func GenerateCategoryColor(category string) string {
 	// Dynamic color assignment using golden angle for maximum visual distinction
@@ -102,6 +111,13 @@ func GenerateCategoryColor(category string) string {
 	// Normalize category name for consistency
 	normalizedCategory := strings.ToUpper(strings.TrimSpace(category))
 
+	categoryColorMu.RLock()
+	color, ok := categoryColorCache[normalizedCategory]
+	categoryColorMu.RUnlock()
+	if ok {
+		return color
+	}
+
 	// Create a hash of the category name for consistent color assignment
 	hash := 0
 	for i, char := range normalizedCategory {
@@ -124,7 +140,13 @@ func GenerateCategoryColor(category string) string {
 	r, g, b := hslToRgb(hue, saturation, lightness)
 
 	// Convert to hex
-	return fmt.Sprintf("#%02X%02X%02X", r, g, b)
+	color = fmt.Sprintf("#%02X%02X%02X", r, g, b)
+
+	categoryColorMu.Lock()
+	categoryColorCache[normalizedCategory] = color
+	categoryColorMu.Unlock()
+
+	return color
 }
 
 // hslToRgb converts HSL color values to RGB
@@ -220,7 +242,9 @@ func CalculateDateRange(tasks []Task) DateRange {
 
 // GetMonthsWithTasks returns a list of unique months that have tasks
 func GetMonthsWithTasks(tasks []Task, dateRange DateRange) []MonthYear {
-	monthMap := make(map[string]MonthYear)
+	// MonthYear is comparable, so it can key the map directly; no formatted
+	// string key needs to be allocated per month.
+	monthSet := make(map[MonthYear]struct{})
 
 	for _, task := range tasks {
 		// Add all months between start and end date
@@ -228,30 +252,24 @@ func GetMonthsWithTasks(tasks []Task, dateRange DateRange) []MonthYear {
 		end := time.Date(task.EndDate.Year(), task.EndDate.Month(), 1, 0, 0, 0, 0, time.UTC)
 
 		for !current.After(end) {
-			key := fmt.Sprintf("%d-%02d", current.Year(), current.Month())
-			monthMap[key] = MonthYear{
-				Year:  current.Year(),
-				Month: current.Month(),
-			}
+			monthSet[MonthYear{Year: current.Year(), Month: current.Month()}] = struct{}{}
 			current = current.AddDate(0, 1, 0)
 		}
 	}
 
 	// Convert map to sorted slice
-	var months []MonthYear
-	for _, month := range monthMap {
+	months := make([]MonthYear, 0, len(monthSet))
+	for month := range monthSet {
 		months = append(months, month)
 	}
 
 	// Sort by year and month
-	for i := 0; i < len(months)-1; i++ {
-		for j := i + 1; j < len(months); j++ {
-			if months[i].Year > months[j].Year ||
-				(months[i].Year == months[j].Year && months[i].Month > months[j].Month) {
-				months[i], months[j] = months[j], months[i]
-			}
+	sort.Slice(months, func(i, j int) bool {
+		if months[i].Year != months[j].Year {
+			return months[i].Year < months[j].Year
 		}
-	}
+		return months[i].Month < months[j].Month
+	})
 
 	return months
 }